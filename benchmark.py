@@ -0,0 +1,281 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from graph_builder import GraphBuilder
+from synthetic_graph import SyntheticGraphGenerator
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Per metric: (floor below which an operation is never flagged, minimum absolute increase).
+# Millisecond timings and tiny memory peaks are dominated by noise between runs.
+REGRESSION_FLOORS = {
+    "min_s": (0.01, 0.005),
+    "peak_memory_bytes": (1_000_000, 512_000),
+}
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def measure(func, repeat=3):
+    """
+    Time func over `repeat` untraced runs, then run it once more under tracemalloc
+    to record peak memory (tracing slows Python down, so it is kept out of the timings).
+
+    Returns:
+        tuple: (stats dict, result of the last timed run)
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    stats = {
+        "runs": repeat,
+        "mean_s": statistics.mean(times),
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+        "max_s": max(times),
+        "peak_memory_bytes": peak,
+    }
+    return stats, result
+
+
+def bench_size(n_edges, seed=42, repeat=3, n_queries=5, depth=3, cutoff=3):
+    """
+    Benchmark ingest and every GraphBuilder query type on one synthetic graph.
+    """
+    gen = SyntheticGraphGenerator(seed=seed)
+    start = time.perf_counter()
+    df, exchanges, peel_chains = gen.generate(n_edges)
+    generate_s = time.perf_counter() - start
+
+    # Ingest: a fresh builder per run so every run does the same amount of work.
+    ingest, G = measure(lambda: GraphBuilder().build_graph(df), repeat=repeat)
+    gb = GraphBuilder()
+    gb.G = G
+    gb.label_entities([], exchanges)
+
+    # Query wallets are drawn from the seed too, so runs are comparable across versions.
+    # Peel chain heads are included because they very likely reach an exchange.
+    rng = np.random.default_rng(seed)
+    senders = df["from"].unique()
+    sources = [chain[0] for chain in peel_chains[:n_queries]]
+    sources += rng.choice(senders, size=max(n_queries - len(sources), 0)).tolist()
+    targets = rng.choice(exchanges, size=len(sources)).tolist()
+
+    queries = {
+        "trace_path": lambda: [gb.trace_path(s, t) for s, t in zip(sources, targets)],
+        "expand_wallet": lambda: [gb.expand_wallet(s, depth=depth) for s in sources],
+        "expand_wallet_full": lambda: [gb.expand_wallet(s) for s in sources],
+        "expand_wallet_outermost": lambda: [
+            gb.expand_wallet(s, depth=depth, outermost_only=True) for s in sources
+        ],
+        "trace_to_all_exchanges": lambda: [
+            gb.trace_to_all_exchanges(s, exchanges, cutoff=cutoff) for s in sources
+        ],
+    }
+
+    results = {}
+    for name, query in queries.items():
+        stats, _ = measure(query, repeat=repeat)
+        stats["mean_per_query_s"] = stats["mean_s"] / len(sources)
+        results[name] = stats
+
+    return {
+        "n_edges_requested": n_edges,
+        "n_transactions": len(df),
+        "n_nodes": G.number_of_nodes(),
+        "n_edges": G.number_of_edges(),
+        "n_exchanges": len(exchanges),
+        "n_peel_chains": len(peel_chains),
+        "n_queries": len(sources),
+        "generate_s": generate_s,
+        "ingest": ingest,
+        "queries": results,
+    }
+
+
+def bench_params(seed=42, repeat=3, n_queries=5, depth=3, cutoff=3):
+    """
+    Settings that must match between two reports for them to be comparable.
+    """
+    return {
+        "seed": seed,
+        "repeat": repeat,
+        "n_queries": n_queries,
+        "depth": depth,
+        "cutoff": cutoff,
+    }
+
+
+def check_comparable(baseline, params, sizes):
+    """
+    Check that a run with `params` over `sizes` can be compared against `baseline`.
+
+    Returns:
+        list: sizes missing from the baseline, which will not be compared.
+
+    Raises:
+        ValueError: if the params differ or no size overlaps with the baseline.
+    """
+    if baseline["params"] != params:
+        raise ValueError(
+            f"Reports were run with different params: {baseline['params']} vs {params}"
+        )
+
+    base_sizes = {r["n_edges_requested"] for r in baseline["results"]}
+    skipped = [n for n in sizes if n not in base_sizes]
+    if len(skipped) == len(sizes):
+        raise ValueError(f"No sizes in common with the baseline (baseline has {sorted(base_sizes)})")
+    return skipped
+
+
+def run(sizes, seed=42, repeat=3, n_queries=5, depth=3, cutoff=3):
+    """
+    Run the benchmark for each size and return a JSON-serialisable report.
+    """
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "networkx": nx.__version__,
+        "pandas": pd.__version__,
+        "params": bench_params(seed, repeat, n_queries, depth, cutoff),
+        "results": [],
+    }
+    for n_edges in sizes:
+        print(f"Benchmarking {n_edges} edges...")
+        result = bench_size(n_edges, seed=seed, repeat=repeat, n_queries=n_queries,
+                            depth=depth, cutoff=cutoff)
+        report["results"].append(result)
+        print(f"  ingest: {result['ingest']['median_s']:.4f}s, "
+              f"peak {result['ingest']['peak_memory_bytes'] / 1e6:.1f} MB")
+        for name, stats in result["queries"].items():
+            print(f"  {name}: {stats['median_s']:.4f}s, "
+                  f"peak {stats['peak_memory_bytes'] / 1e6:.1f} MB")
+    return report
+
+
+def compare(baseline, current, threshold=1.2):
+    """
+    Compare two benchmark reports by best-of-runs time and peak memory.
+
+    A metric is flagged only when it is above its floor in REGRESSION_FLOORS, exceeds the
+    baseline by more than `threshold` and grows by at least the minimum absolute delta.
+    Sizes missing from the baseline are skipped (see check_comparable).
+
+    Returns:
+        list: one dict per (size, operation, metric) regression.
+
+    Raises:
+        ValueError: if the reports are not comparable.
+    """
+    check_comparable(baseline, current["params"], [r["n_edges_requested"] for r in current["results"]])
+
+    base_by_size = {r["n_edges_requested"]: r for r in baseline["results"]}
+    regressions = []
+
+    for result in current["results"]:
+        base = base_by_size.get(result["n_edges_requested"])
+        if base is None:
+            continue
+
+        ops = [("ingest", base["ingest"], result["ingest"])]
+        ops += [(name, base["queries"][name], stats)
+                for name, stats in result["queries"].items() if name in base["queries"]]
+
+        for name, old, new in ops:
+            for metric, (floor, min_delta) in REGRESSION_FLOORS.items():
+                if new[metric] < floor:
+                    continue
+                if new[metric] > old[metric] * threshold and new[metric] - old[metric] >= min_delta:
+                    regressions.append({
+                        "n_edges": result["n_edges_requested"],
+                        "operation": name,
+                        "metric": metric,
+                        "baseline": old[metric],
+                        "current": new[metric],
+                        "ratio": new[metric] / old[metric] if old[metric] else None,
+                    })
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark GraphBuilder on synthetic transaction graphs.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Number of transactions per synthetic graph.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per operation.")
+    parser.add_argument("--queries", type=int, default=5, help="Query wallets per operation.")
+    parser.add_argument("--depth", type=int, default=3, help="Depth for expand_wallet.")
+    parser.add_argument("--cutoff", type=int, default=3, help="Cutoff for trace_to_all_exchanges.")
+    parser.add_argument("--output", default="bench_results.json", help="Where to write the JSON report.")
+    parser.add_argument("--compare", help="Baseline JSON report to check for regressions.")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="Ratio over baseline reported as a regression.")
+    args = parser.parse_args()
+
+    # Validate the baseline before running so a mismatch does not throw away a long run.
+    skipped = []
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        params = bench_params(args.seed, args.repeat, args.queries, args.depth, args.cutoff)
+        try:
+            skipped = check_comparable(baseline, params, args.sizes)
+        except ValueError as e:
+            print("Error:", e)
+            sys.exit(2)
+        if skipped:
+            print("Sizes not in baseline, will not be compared:", skipped)
+
+    report = run(args.sizes, seed=args.seed, repeat=args.repeat, n_queries=args.queries,
+                 depth=args.depth, cutoff=args.cutoff)
+
+    regressions = []
+    if args.compare:
+        regressions = compare(baseline, report, threshold=args.threshold)
+        report["baseline"] = args.compare
+        report["skipped_sizes"] = skipped
+        report["regressions"] = regressions
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print("Results written to", args.output)
+
+    if args.compare:
+        if not regressions:
+            print("No regressions against", args.compare)
+        for r in regressions:
+            ratio = f"{r['ratio']:.2f}x" if r["ratio"] else "new"
+            print(f"REGRESSION {r['operation']} @ {r['n_edges']} edges: "
+                  f"{r['metric']} {r['baseline']:.4g} -> {r['current']:.4g} ({ratio})")
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+
+
+class SyntheticGraphGenerator:
+    def __init__(self, seed=42, n_exchanges=10, avg_degree=4.0, power_law_exponent=2.1,
+                 exchange_fraction=0.15, peel_fraction=0.1, peel_chain_length=20,
+                 start_timestamp=1694179200):
+        """
+        Seeded generator for synthetic Ethereum-style transaction graphs.
+
+        Args:
+            seed (int): Seed for the random generator. Same seed + same size -> same graph.
+            n_exchanges (int): Number of exchange hub wallets (at least 1).
+            avg_degree (float): Background transactions per ordinary wallet; sets the wallet count
+                to n_background / avg_degree. Each transaction has two endpoints and exchanges take
+                a large share, so an ordinary wallet's mean in + out degree ends up near
+                1.5 * avg_degree (about 6 at the defaults).
+            power_law_exponent (float): Exponent of the wallet degree distribution (> 1).
+            exchange_fraction (float): Extra share of background transactions forced onto an exchange.
+                Exchanges also hold the top power-law ranks, so the share of all transactions
+                touching an exchange is much higher (about 43% at the defaults).
+            peel_fraction (float): Share of all transactions spent on peel chains.
+            peel_chain_length (int): Hops per peel chain.
+            start_timestamp (int): Unix timestamp of the first transaction.
+        """
+        if n_exchanges < 1:
+            raise ValueError("n_exchanges must be at least 1")
+        if avg_degree <= 0:
+            raise ValueError("avg_degree must be greater than 0")
+        if power_law_exponent <= 1:
+            raise ValueError("power_law_exponent must be greater than 1")
+        if not 0 <= exchange_fraction <= 1 or not 0 <= peel_fraction <= 1:
+            raise ValueError("exchange_fraction and peel_fraction must be between 0 and 1")
+        if peel_chain_length < 1:
+            raise ValueError("peel_chain_length must be at least 1")
+
+        self.seed = seed
+        self.n_exchanges = n_exchanges
+        self.avg_degree = avg_degree
+        self.power_law_exponent = power_law_exponent
+        self.exchange_fraction = exchange_fraction
+        self.peel_fraction = peel_fraction
+        self.peel_chain_length = peel_chain_length
+        self.start_timestamp = start_timestamp
+
+    def _addresses(self, rng, n):
+        """
+        Generate n random 0x-prefixed, 40 hex digit wallet addresses.
+        """
+        raw = rng.bytes(20 * n).hex()
+        return ["0x" + raw[i * 40:(i + 1) * 40] for i in range(n)]
+
+    def _power_law_weights(self, n):
+        """
+        Sampling weights giving a degree distribution P(k) ~ k^-power_law_exponent.
+        """
+        ranks = np.arange(1, n + 1, dtype=np.float64)
+        weights = ranks ** (-1.0 / (self.power_law_exponent - 1.0))
+        return weights / weights.sum()
+
+    def generate(self, n_edges):
+        """
+        Generate a transaction dataframe with roughly n_edges rows.
+
+        Returns:
+            tuple: (df, exchanges, peel_chains)
+                - df: columns ['from', 'to', 'value', 'timeStamp', 'hash'], sorted by time
+                - exchanges: list of exchange hub addresses
+                - peel_chains: list of peel chains, each a list of wallet addresses in hop order
+        """
+        if n_edges < 1:
+            raise ValueError("n_edges must be at least 1")
+
+        rng = np.random.default_rng(self.seed)
+
+        n_peel_chains = int(n_edges * self.peel_fraction) // (2 * self.peel_chain_length)
+        n_peel_edges = n_peel_chains * 2 * self.peel_chain_length
+        n_background = n_edges - n_peel_edges
+        n_wallets = max(int(n_background / self.avg_degree), 2)
+
+        exchanges = self._addresses(rng, self.n_exchanges)
+        wallets = self._addresses(rng, n_wallets)
+        n_exchanges = len(exchanges)
+
+        # Index space: [0, n_wallets) ordinary wallets, [n_wallets, n_wallets + n_exchanges) exchanges,
+        # after that the fresh intermediaries of the peel chains.
+        senders, receivers, values = self._background(rng, n_background, n_wallets, n_exchanges)
+        peel_senders, peel_receivers, peel_values, peel_chains = self._peel_chains(
+            rng, n_peel_chains, n_wallets, n_exchanges
+        )
+
+        peel_wallets = self._addresses(rng, n_peel_chains * self.peel_chain_length)
+        addresses = np.array(wallets + exchanges + peel_wallets, dtype=object)
+
+        senders = np.concatenate([senders, peel_senders])
+        receivers = np.concatenate([receivers, peel_receivers])
+        values = np.concatenate([values, peel_values])
+
+        # Background and peel transactions are interleaved over time; each peel chain hops forward in time.
+        timestamps = np.concatenate([
+            rng.integers(0, 365 * 86400, size=n_background),
+            self._peel_timestamps(rng, n_peel_chains),
+        ]) + self.start_timestamp
+        order = np.argsort(timestamps, kind="stable")
+
+        df = pd.DataFrame({
+            "from": addresses[senders[order]],
+            "to": addresses[receivers[order]],
+            "value": np.round(values[order], 6),
+            "timeStamp": timestamps[order],
+        })
+        df["hash"] = [f"0x{i:064x}" for i in range(len(df))]
+
+        peel_chains = [addresses[chain].tolist() for chain in peel_chains]
+        return df, exchanges, peel_chains
+
+    def _background(self, rng, n, n_wallets, n_exchanges):
+        """
+        Power-law wallet-to-wallet traffic plus deposits to / withdrawals from exchange hubs.
+
+        Exchanges take the top power-law ranks and get the extra exchange_fraction traffic on
+        top, so every exchange out-ranks every ordinary wallet by degree.
+        """
+        n_total = n_wallets + n_exchanges
+        weights = self._power_law_weights(n_total)
+        hubs = np.arange(n_wallets, n_total)
+        # Shuffle ordinary wallets separately per side so the heavy senders are not also the heavy receivers.
+        send_map = np.concatenate([hubs, rng.permutation(n_wallets)])
+        recv_map = np.concatenate([hubs, rng.permutation(n_wallets)])
+        senders = send_map[rng.choice(n_total, size=n, p=weights)]
+        receivers = recv_map[rng.choice(n_total, size=n, p=weights)]
+
+        touches_exchange = rng.random(n) < self.exchange_fraction
+        hub = n_wallets + rng.integers(0, n_exchanges, size=n)
+        deposit = rng.random(n) < 0.6
+        receivers = np.where(touches_exchange & deposit, hub, receivers)
+        senders = np.where(touches_exchange & ~deposit, hub, senders)
+
+        # Avoid self-transfers.
+        loops = senders == receivers
+        receivers[loops] = (receivers[loops] + 1) % n_total
+
+        values = rng.lognormal(mean=-1.0, sigma=2.0, size=n)
+        return senders, receivers, values
+
+    def _peel_chains(self, rng, n_chains, n_wallets, n_exchanges):
+        """
+        Peel chains: a funded wallet repeatedly forwards most of its balance to a fresh
+        wallet and "peels" a small amount off to an exchange (or a random wallet).
+        """
+        length = self.peel_chain_length
+        senders, receivers, values, chains = [], [], [], []
+        next_fresh = n_wallets + n_exchanges
+
+        for _ in range(n_chains):
+            chain = [int(rng.integers(0, n_wallets))]
+            chain += list(range(next_fresh, next_fresh + length))
+            next_fresh += length
+
+            balance = float(rng.uniform(50, 5000))
+            for hop in range(length):
+                peel = balance * float(rng.uniform(0.01, 0.1))
+                balance -= peel
+                if rng.random() < 0.7:
+                    peel_target = n_wallets + int(rng.integers(0, n_exchanges))
+                else:
+                    peel_target = int(rng.integers(0, n_wallets))
+                    # Avoid self-transfers from the chain head.
+                    if peel_target == chain[hop]:
+                        peel_target = (peel_target + 1) % n_wallets
+
+                senders += [chain[hop], chain[hop]]
+                receivers += [chain[hop + 1], peel_target]
+                values += [balance, peel]
+            chains.append(chain)
+
+        return (np.array(senders, dtype=np.int64), np.array(receivers, dtype=np.int64),
+                np.array(values, dtype=np.float64), chains)
+
+    def _peel_timestamps(self, rng, n_chains):
+        """
+        Monotonic timestamps for each peel chain: one forward + one peel transaction per hop.
+        """
+        length = self.peel_chain_length
+        if not n_chains:
+            return np.empty(0, dtype=np.int64)
+        starts = rng.integers(0, 300 * 86400, size=(n_chains, 1))
+        gaps = np.cumsum(rng.integers(60, 6 * 3600, size=(n_chains, length)), axis=1)
+        hop_times = starts + gaps
+        return np.repeat(hop_times, 2, axis=1).ravel()
+
+
+if __name__ == "__main__":
+    gen = SyntheticGraphGenerator(seed=42)
+    df, exchanges, peel_chains = gen.generate(10000)
+
+    print(df.head())
+    print("transactions:", len(df), "exchanges:", len(exchanges), "peel_chains:", len(peel_chains))
@@ -0,0 +1,121 @@
+import pytest
+
+from benchmark import compare, run
+from synthetic_graph import SyntheticGraphGenerator
+
+PARAMS = {"seed": 42, "repeat": 3, "n_queries": 5, "depth": 3, "cutoff": 3}
+
+
+def _report(ingest, queries=None, params=PARAMS):
+    return {
+        "params": dict(params),
+        "results": [{"n_edges_requested": 1000, "ingest": ingest, "queries": queries or {}}],
+    }
+
+
+def _stats(min_s, peak):
+    return {"min_s": min_s, "peak_memory_bytes": peak}
+
+
+def test_same_seed_same_dataframe():
+    a, ex_a, chains_a = SyntheticGraphGenerator(seed=7).generate(5000)
+    b, ex_b, chains_b = SyntheticGraphGenerator(seed=7).generate(5000)
+    assert a.equals(b)
+    assert ex_a == ex_b
+    assert chains_a == chains_b
+
+
+def test_different_seed_different_dataframe():
+    a, _, _ = SyntheticGraphGenerator(seed=1).generate(2000)
+    b, _, _ = SyntheticGraphGenerator(seed=2).generate(2000)
+    assert not a.equals(b)
+
+
+def test_shape_and_no_self_transfers():
+    df, _, _ = SyntheticGraphGenerator().generate(10000)
+    assert len(df) == 10000
+    assert list(df.columns) == ["from", "to", "value", "timeStamp", "hash"]
+    assert not (df["from"] == df["to"]).any()
+    assert df["timeStamp"].is_monotonic_increasing
+    assert df["hash"].is_unique
+
+
+def test_no_self_transfers_in_peel_chains():
+    # Few ordinary wallets, so peels to a random wallet often draw the chain head.
+    gen = SyntheticGraphGenerator(avg_degree=1000, peel_fraction=0.5)
+    for seed in [42] + list(range(10)):
+        gen.seed = seed
+        df, _, chains = gen.generate(1000)
+        assert chains
+        assert not (df["from"] == df["to"]).any()
+
+
+def test_peel_chains_well_formed():
+    gen = SyntheticGraphGenerator(peel_chain_length=5)
+    df, _, chains = gen.generate(10000)
+    assert chains
+    edges = set(zip(df["from"], df["to"]))
+    times = dict(zip(zip(df["from"], df["to"]), df["timeStamp"]))
+    for chain in chains:
+        assert len(chain) == 6
+        assert len(set(chain)) == 6
+        hops = list(zip(chain, chain[1:]))
+        assert all(hop in edges for hop in hops)
+        hop_times = [times[hop] for hop in hops]
+        assert hop_times == sorted(hop_times)
+
+
+def test_exchanges_are_largest_hubs():
+    df, exchanges, _ = SyntheticGraphGenerator().generate(100000)
+    degree = df["from"].value_counts().add(df["to"].value_counts(), fill_value=0)
+    assert degree[exchanges].min() >= degree.drop(exchanges).max()
+
+
+def test_rejects_invalid_params():
+    with pytest.raises(ValueError):
+        SyntheticGraphGenerator(n_exchanges=0)
+    with pytest.raises(ValueError):
+        SyntheticGraphGenerator(avg_degree=0)
+
+
+def test_compare_flags_real_regression():
+    baseline = _report(_stats(1.0, 50_000_000))
+    current = _report(_stats(2.0, 100_000_000))
+    regressions = compare(baseline, current)
+    assert {(r["operation"], r["metric"]) for r in regressions} == {
+        ("ingest", "min_s"),
+        ("ingest", "peak_memory_bytes"),
+    }
+
+
+def test_compare_ignores_noise():
+    # Large ratios on tiny timings / memory peaks, and small ratios on large ones.
+    baseline = _report(_stats(1.0, 50_000_000), {"trace_path": _stats(0.001, 100)})
+    current = _report(_stats(1.1, 55_000_000), {"trace_path": _stats(0.003, 130)})
+    assert compare(baseline, current) == []
+
+
+def test_compare_refuses_mismatched_params():
+    baseline = _report(_stats(1.0, 100))
+    current = _report(_stats(1.0, 100), params=dict(PARAMS, n_queries=50))
+    with pytest.raises(ValueError):
+        compare(baseline, current)
+
+
+def test_compare_refuses_no_common_sizes():
+    baseline = _report(_stats(1.0, 100))
+    current = _report(_stats(1.0, 100))
+    current["results"][0]["n_edges_requested"] = 2000
+    with pytest.raises(ValueError):
+        compare(baseline, current)
+
+
+def test_run_report_round_trips_through_compare():
+    report = run([1000], repeat=1, n_queries=2)
+    result = report["results"][0]
+    assert result["n_edges_requested"] == 1000
+    assert set(result["queries"]) == {
+        "trace_path", "expand_wallet", "expand_wallet_full",
+        "expand_wallet_outermost", "trace_to_all_exchanges",
+    }
+    assert compare(report, report) == []